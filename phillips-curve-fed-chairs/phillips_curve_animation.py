@@ -15,23 +15,41 @@ Data sources: Federal Reserve Economic Data (FRED)
 - CPILFESL: Core CPI (Consumer Price Index)
 """
 
+import os
+import subprocess
+import time
+from collections import deque
+from multiprocessing import Pool
+from pathlib import Path
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import numpy as np
 import pandas as pd
 import pandas_datareader.data as web
 from tqdm import tqdm
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
 from matplotlib.patches import Polygon, Rectangle
 
-#Pull data from Fred
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the decorated functions then run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+#FRED series are cached locally for up to a day so re-runs skip the network
 start_date = '1970-01-01'
 end_date = '2025-12-31'
-unemployment = web.DataReader('UNRATE', 'fred', start_date, end_date)
-core_pce = web.DataReader('CPILFESL', 'fred', start_date, end_date)
-core_pce_yoy = core_pce.pct_change(periods=12) * 100
-data = pd.merge(unemployment, core_pce_yoy, left_index=True, right_index=True)
-data.columns = ['unemployment', 'core_cpi_yoy']
-data = data.dropna()
+fred_cache = Path(f'fred_cache_{start_date}_{end_date}.parquet')  # a new date range never reads an old cache
+fred_cache_max_age = 24 * 60 * 60  # seconds
+
+def load_fred_data():
+    """Pull UNRATE and CPILFESL from FRED, or from the local cache while it is fresh"""
+    if fred_cache.exists() and time.time() - fred_cache.stat().st_mtime < fred_cache_max_age:
+        return pd.read_parquet(fred_cache)
+    fred_data = pd.concat([web.DataReader('UNRATE', 'fred', start_date, end_date),
+                           web.DataReader('CPILFESL', 'fred', start_date, end_date)], axis=1)
+    fred_data.to_parquet(fred_cache)
+    return fred_data
 
 fed_chairs = [
     ('Arthur Burns', '1970-02-01', '1978-01-31'),
@@ -43,224 +61,409 @@ fed_chairs = [
     ('Jerome Powell', '2018-02-05', '2025-12-31')
 ]
 
-#determines fed_chair for a given date
-def assign_fed_chair(date):
-    for chair, start, end in fed_chairs:
-        if pd.to_datetime(start) <= date <= pd.to_datetime(end):
-            return chair
-    return 'Other'
-data['fed_chair'] = data.index.map(assign_fed_chair)
-data = data[data['fed_chair'] != 'Other']
-data = data.reset_index()
-data = data.sort_values('DATE')
-
-def rgb_to_matplotlib(rgb_string):
-    rgb_values = rgb_string.replace('rgb(', '').replace(')', '').split(',')
-    r, g, b = [int(x.strip()) / 255.0 for x in rgb_values]
-    return (r, g, b)
+#tenure boundaries parsed to Timestamps once
+fed_chairs_ts = [(chair, pd.Timestamp(start), pd.Timestamp(end)) for chair, start, end in fed_chairs]
+
+#tenure boundaries as arrays for the searchsorted lookup in prepare_data()
+chair_names = np.array([chair for chair, _, _ in fed_chairs_ts])
+chair_starts = pd.DatetimeIndex([start for _, start, _ in fed_chairs_ts]).values
+chair_ends = pd.DatetimeIndex([end for _, _, end in fed_chairs_ts]).values
+
+@njit(cache=True)
+def polygon_area(xs, ys):
+    """Area filled by a Polygon through (xs, ys), under the nonzero winding rule Agg fills with.
+
+    The paths cross themselves, so the shoelace sum would cancel loops traced in opposite
+    directions. Instead the plane is cut into horizontal slabs at every vertex and edge
+    crossing; inside a slab no edges cross, so its filled width is linear in y and the slab
+    contributes its height times the filled width at mid-height.
+    """
+    n = len(xs)
+    cut_ys = [y for y in ys]
+    for i in range(n):
+        i2 = (i + 1) % n
+        for j in range(i + 2, n):
+            j2 = (j + 1) % n
+            if j2 == i:
+                continue
+            denom = (xs[i2] - xs[i]) * (ys[j2] - ys[j]) - (ys[i2] - ys[i]) * (xs[j2] - xs[j])
+            if denom == 0:
+                continue
+            t = ((xs[j] - xs[i]) * (ys[j2] - ys[j]) - (ys[j] - ys[i]) * (xs[j2] - xs[j])) / denom
+            u = ((xs[j] - xs[i]) * (ys[i2] - ys[i]) - (ys[j] - ys[i]) * (xs[i2] - xs[i])) / denom
+            if 0 < t < 1 and 0 < u < 1:
+                cut_ys.append(ys[i] + t * (ys[i2] - ys[i]))
+    cuts = np.unique(np.array(cut_ys))
+
+    area = 0.0
+    cross_x = np.empty(n)
+    cross_dir = np.empty(n, dtype=np.int64)
+    for k in range(len(cuts) - 1):
+        y = (cuts[k] + cuts[k + 1]) / 2
+        #where each edge spanning this slab crosses its mid-height, and whether it runs up or down
+        m = 0
+        for i in range(n):
+            i2 = (i + 1) % n
+            if (ys[i] < y) != (ys[i2] < y):
+                cross_x[m] = xs[i] + (y - ys[i]) * (xs[i2] - xs[i]) / (ys[i2] - ys[i])
+                cross_dir[m] = 1 if ys[i2] > ys[i] else -1
+                m += 1
+        order = np.argsort(cross_x[:m])
+        winding = 0
+        width = 0.0
+        for idx in range(m):
+            if winding != 0:
+                width += cross_x[order[idx]] - cross_x[order[idx - 1]]
+            winding += cross_dir[order[idx]]
+        area += (cuts[k + 1] - cuts[k]) * width
+    return area
 
 mpl_chair_colors = {
-    'Arthur Burns': rgb_to_matplotlib('rgb(228,26,28)'),
-    'William Miller': rgb_to_matplotlib('rgb(55,126,184)'),
-    'Paul Volcker': rgb_to_matplotlib('rgb(77,175,74)'),
-    'Alan Greenspan': rgb_to_matplotlib('rgb(152,78,163)'),
-    'Ben Bernanke': rgb_to_matplotlib('rgb(255,127,0)'),
-    'Janet Yellen': rgb_to_matplotlib('rgb(255,255,51)'),
-    'Jerome Powell': rgb_to_matplotlib('rgb(166,86,40)')
+    'Arthur Burns': (228/255, 26/255, 28/255),
+    'William Miller': (55/255, 126/255, 184/255),
+    'Paul Volcker': (77/255, 175/255, 74/255),
+    'Alan Greenspan': (152/255, 78/255, 163/255),
+    'Ben Bernanke': (255/255, 127/255, 0/255),
+    'Janet Yellen': (255/255, 255/255, 51/255),
+    'Jerome Powell': (166/255, 86/255, 40/255)
 }
 
-fig, ax = plt.subplots(figsize=(8, 6))
-plt.style.use('default')
+# Render resolution; Agg rendering cost grows with the number of pixels per frame, so frames
+# are rendered at 480x360 and ffmpeg upscales them to output_size
+render_dpi = 60
+output_size = (800, 600)
+
+def prepare_data(fred_data):
+    """Compute core CPI YoY and each month's Fed Chair, plus the per-chair and per-row arrays animate() indexes"""
+    global data, chair_arrays, chair_start_index, chair_end_index
+    global row_chair, row_points, row_date_label, row_month_label, row_colors
+    #both series already share fred_data's monthly index, so the YoY change is a shifted
+    #array division and no merge is needed
+    core_cpi = fred_data['CPILFESL'].to_numpy()
+    core_cpi_yoy = np.full_like(core_cpi, np.nan)
+    core_cpi_yoy[12:] = (core_cpi[12:] / core_cpi[:-12] - 1.0) * 100.0
+    data = pd.DataFrame({'unemployment': fred_data['UNRATE'].to_numpy(), 'core_cpi_yoy': core_cpi_yoy},
+                        index=fred_data.index)
+    data = data.dropna()
+
+    #determines fed_chair for every date at once: find the first tenure ending on or
+    #after each date, then drop dates that fall before that tenure started
+    chair_idx = np.searchsorted(chair_ends, data.index.values, side='left')
+    in_tenure = chair_idx < len(fed_chairs)
+    chair_idx = chair_idx.clip(max=len(fed_chairs) - 1)
+    in_tenure &= data.index.values >= chair_starts[chair_idx]
+    data['fed_chair'] = np.where(in_tenure, chair_names[chair_idx], 'Other')
+    data = data[data['fed_chair'] != 'Other']
+    data = data.reset_index()
+    data = data.sort_values('DATE')
+
+    #per-chair (unemployment, core_cpi_yoy) arrays in date order, built once so the
+    #animation only has to slice them
+    chair_arrays = {
+        chair: (grp['unemployment'].to_numpy(), grp['core_cpi_yoy'].to_numpy())
+        for chair, grp in data.groupby('fed_chair', sort=False)
+    }
+
+    #row index of the first and last month of each chair's tenure; each chair's rows are contiguous
+    chair_rows = data.index.to_series().groupby(data['fed_chair'], sort=False)
+    chair_start_index = chair_rows.min().to_dict()
+    chair_end_index = chair_rows.max().to_dict()
 
-# Keep track of completed Fed Chair shapes
-completed_shapes = {}
+    #per-row lookups so the animation indexes arrays instead of slicing the DataFrame
+    row_chair = data['fed_chair'].to_numpy()
+    row_points = data[['unemployment', 'core_cpi_yoy']].to_numpy()
+    row_date_label = data['DATE'].dt.strftime('%b %Y').to_numpy()
+    row_month_label = data['DATE'].dt.strftime('%Y-%m').to_numpy()
 
-# Global variable to track progress
-pbar = None
+    #RGBA color of every row's point, so frames slice it instead of building color lists
+    row_colors = to_rgba_array([mpl_chair_colors[chair] for chair in row_chair])
 
-def draw_preview_frame(ax):
-    ax.clear()
+def build_figure():
+    """Create the figure and every artist animate() updates"""
+    global fig, title, target_label, completed_shapes, chair_paths, chair_points, highlight
+    global we_are_here, preview_text, date_text, legend, frame_artists, background, background_state
+    fig, ax = plt.subplots(figsize=(8, 6), dpi=render_dpi)
+    # Set after the style reset; paths read the threshold when they are created
+    plt.style.use(['default', {'path.simplify_threshold': 1.0}])
     ax.set_facecolor('white')
-    
+    ax.set_xlim(0, 15)
+    ax.set_ylim(0, 15)
+    ax.set_xlabel('Unemployment Rate (%)')
+    ax.set_ylabel('Core CPI YoY (%)')
+    ax.grid(True, alpha=0.3)
+    title = ax.set_title('')
+
+    # Add Fed dual mandate target box with higher contrast
     target_box = Rectangle((4, 2), 2, 1, facecolor='gray', alpha=0.5, 
                           edgecolor='black', linewidth=2, linestyle='-')
     ax.add_patch(target_box)
-    ax.text(5, 2.5, 'Fed Target', ha='center', va='center', 
-            fontsize=8, alpha=1.0, weight='bold')
-    
-    for chair in ['Arthur Burns', 'William Miller', 'Paul Volcker', 'Alan Greenspan', 'Ben Bernanke', 'Janet Yellen', 'Jerome Powell']:
-        chair_data = data[data['fed_chair'] == chair].sort_values('DATE')
-        if len(chair_data) >= 3:
-            points = list(zip(chair_data['unemployment'], chair_data['core_cpi_yoy']))
+    target_label = ax.text(5, 2.5, 'Fed Target', ha='center', va='center', 
+                           fontsize=8, alpha=1.0, weight='bold')
+
+    # Filled shapes for completed Fed Chairs, hidden until their term ends
+    completed_shapes = {}
+    for chair, (unemp, cpi) in chair_arrays.items():
+        if len(unemp) >= 3:  # Need at least 3 points to make a polygon
+            points = np.column_stack([unemp, cpi])
             color = mpl_chair_colors[chair]
-            darker_color = tuple(c * 0.5 for c in color)
-            polygon = Polygon(points, facecolor=color, alpha=0.3, edgecolor=darker_color, linewidth=2)
+            darker_color = tuple(c * 0.5 for c in color)  # Makes it 50% darker
+            polygon = Polygon(points, facecolor=color, alpha=0.3, edgecolor=darker_color, linewidth=2,
+                              visible=False)
             ax.add_patch(polygon)
-    
+            completed_shapes[chair] = polygon
+
+    # Path lines and points of every chair in progress, one collection each, updated in place every frame
+    chair_paths = LineCollection([], linewidths=2, alpha=0.8, antialiaseds=False,
+                                 joinstyle='round', capstyle='projecting')
+    ax.add_collection(chair_paths, autolim=False)
+    chair_points = ax.scatter([], [], s=30, alpha=0.9, edgecolors='white', linewidths=1)
+
+    #this creates a "pulsing" effect as each new point gets highlighted
+    highlight = ax.scatter([], [], s=50, facecolors='none', linewidths=3)
+
     final_point = data.iloc[-1]
-    ax.annotate('We are here', 
-               xy=(final_point['unemployment'], final_point['core_cpi_yoy']),
-               xytext=(final_point['unemployment'] + 1.5, final_point['core_cpi_yoy'] + 1),
-               arrowprops=dict(arrowstyle='->', color='black', lw=2),
-               fontsize=10, weight='bold', ha='left')
-    
-    ax.text(0.02, 0.95, 'PREVIEW', transform=ax.transAxes, fontsize=16, 
-            weight='bold', ha='left', va='top', alpha=0.8, color='red',
-            bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.9, edgecolor='red'))
-    
-    final_date = data.iloc[-1]['DATE']
-    date_text = final_date.strftime("%b %Y")
-    ax.text(0.98, 0.95, date_text, transform=ax.transAxes, fontsize=24, 
-            weight='bold', ha='right', va='top', alpha=0.7,
-            bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.8, edgecolor='gray'))
-    
-    ax.set_xlim(0, 15)
-    ax.set_ylim(0, 15)
-    ax.set_xlabel('Unemployment Rate (%)')
-    ax.set_ylabel('Core CPI YoY (%)')
-    ax.set_title(f'Phillips Curve Evolution by Fed Chair (1970-{final_date.strftime("%Y")})')
-    
-    #create legend
+    we_are_here = ax.annotate('We are here', 
+                              xy=(final_point['unemployment'], final_point['core_cpi_yoy']),
+                              xytext=(final_point['unemployment'] + 1.5, final_point['core_cpi_yoy'] + 1),
+                              arrowprops=dict(arrowstyle='->', color='black', lw=2),
+                              fontsize=10, weight='bold', ha='left')
+
+    preview_text = ax.text(0.02, 0.95, 'PREVIEW', transform=ax.transAxes, fontsize=16, 
+                           weight='bold', ha='left', va='top', alpha=0.8, color='red',
+                           bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.9, edgecolor='red'))
+
+    # Large backdrop date display
+    date_text = ax.text(0.98, 0.95, '', transform=ax.transAxes, fontsize=24, 
+                        weight='bold', ha='right', va='top', alpha=0.7,
+                        bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.8, edgecolor='gray'))
+
+    # Legend with every chair, built once; chairs yet to take office are hidden via alpha
     legend_elements = []
     for chair, color in mpl_chair_colors.items():
         legend_elements.append(plt.Line2D([0], [0], marker='o', color='w', 
                                         markerfacecolor=color, markersize=6, label=chair))
+    legend = ax.legend(handles=legend_elements, loc='upper left', fontsize=8)
+
+    # Artists redrawn every frame by render_frame(), in drawing order. Everything else (axes,
+    # ticks, legend, completed polygons, ...) only changes when a chair takes office or
+    # completes, so it is rendered once per such state into a cached background.
+    frame_artists = [chair_points, highlight, chair_paths, target_label, we_are_here, date_text, title]
+    for artist in frame_artists:
+        artist.set_animated(True)
+    background = None
+    background_state = None
+
+def init_renderer(fred_data, areas=None):
+    """Set up this process to render frames; also the Pool initializer, so every worker renders
+    from the parent's fred_data and chair areas instead of fetching or recomputing its own"""
+    global chair_areas
+    prepare_data(fred_data)
+    # Area each completed chair's filled shape covers, shown in the legend; polygons need 3+ points
+    if areas is None:
+        areas = {chair: polygon_area(unemp, cpi) for chair, (unemp, cpi) in chair_arrays.items() if len(unemp) >= 3}
+    chair_areas = areas
+    build_figure()
+
+def show_legend_chairs(visible_chairs):
+    for chair, text, handle in zip(mpl_chair_colors, legend.get_texts(), legend.legend_handles):
+        alpha = 1.0 if chair in visible_chairs else 0.0
+        text.set_alpha(alpha)
+        handle.set_alpha(alpha)
+
+def label_legend_areas(completed_chairs):
+    # Completed chairs show the area of their filled shape (unemployment % x core CPI YoY %)
+    for chair, text in zip(mpl_chair_colors, legend.get_texts()):
+        if chair in completed_chairs and chair in chair_areas:
+            text.set_text(f'{chair} (area {chair_areas[chair]:.1f})')
+        else:
+            text.set_text(chair)
+
+def draw_preview_frame():
+    # Show every tenure as a filled shape with no paths in progress
+    for polygon in completed_shapes.values():
+        polygon.set_visible(True)
+    chair_paths.set_segments([])
+    chair_points.set_offsets(np.empty((0, 2)))
+    highlight.set_visible(False)
+    we_are_here.set_visible(True)
+    preview_text.set_visible(True)
     
-    ax.legend(handles=legend_elements, loc='upper left', fontsize=8)
-    ax.grid(True, alpha=0.3)
+    final_date = data.iloc[-1]['DATE']
+    date_text.set_text(final_date.strftime("%b %Y"))
     
-def get_completed_chairs_at_frame(frame):
-    """Get list of Fed Chairs whose terms have been completed by this frame to draw as filled polygons"""
-    current_data = data.iloc[:frame+2]
-    completed_chairs = []
+    title.set_text(f'Phillips Curve Evolution by Fed Chair (1970-{final_date.strftime("%Y")})')
     
-    for chair in ['Arthur Burns', 'William Miller', 'Paul Volcker', 'Alan Greenspan', 'Ben Bernanke', 'Janet Yellen', 'Jerome Powell']:
-        chair_data = current_data[current_data['fed_chair'] == chair]
-        remaining_data = data.iloc[frame+2:]
-        if len(chair_data) > 0 and chair not in remaining_data['fed_chair'].values:
-            completed_chairs.append(chair)
+    show_legend_chairs(mpl_chair_colors)
+    label_legend_areas(completed_shapes)
     
-    return completed_chairs
+def get_completed_chairs_at_frame(frame):
+    """Get list of Fed Chairs whose terms have been completed by this frame to draw as filled polygons"""
+    # A chair is complete once every row of their tenure is within the first frame+2 rows
+    return [chair for chair, end_index in chair_end_index.items() if end_index < frame + 2]
 
 def animate(frame):
-    global pbar, completed_shapes
-    if pbar is not None:
-        pbar.update(1)
-    
     # Special handling for preview frame (frame = -1)
     if frame == -1:
-        draw_preview_frame(ax)
+        draw_preview_frame()
         return
     
-    ax.clear()
-    ax.set_facecolor('white')
+    preview_text.set_visible(False)
     
-    # Add Fed dual mandate target box with higher contrast
-    target_box = Rectangle((4, 2), 2, 1, facecolor='gray', alpha=0.5, 
-                          edgecolor='black', linewidth=2, linestyle='-')
-    ax.add_patch(target_box)
-    ax.text(5, 2.5, 'Fed Target', ha='center', va='center', 
-            fontsize=8, alpha=1.0, weight='bold')
-    
-    """current_datais a slice of the full dataset that represents all the economic data from the beginning
-    up to the current animation frame"""
-    current_data = data.iloc[:frame+2]
+    # Row of the data point the animation has reached
+    current_row = min(frame + 1, len(data) - 1)
     
-    # Plot filled shapes for completed Fed Chairs
+    # Show filled shapes for completed Fed Chairs
     completed_chairs = get_completed_chairs_at_frame(frame)
-    for chair in completed_chairs:
-        if chair not in completed_shapes:
-            # Create the filled shape for this completed chair
-            chair_data = data[data['fed_chair'] == chair].sort_values('DATE')
-            if len(chair_data) >= 3:  # Need at least 3 points to make a polygon
-                points = list(zip(chair_data['unemployment'], chair_data['core_cpi_yoy']))
-                color = mpl_chair_colors[chair]
-                
-                # Create polygon and add to completed shapes
-                darker_color = tuple(c * 0.5 for c in color)  # Makes it 50% darker
-                polygon = Polygon(points, facecolor=color, alpha=0.3, edgecolor=darker_color, linewidth=2)
-                completed_shapes[chair] = polygon
-        
-        # Draw the completed shape
-        if chair in completed_shapes:
-            ax.add_patch(completed_shapes[chair])
+    for chair, polygon in completed_shapes.items():
+        polygon.set_visible(chair in completed_chairs)
+    label_legend_areas(completed_chairs)
     
-    # Plot connecting lines for current data
-    for chair in current_data['fed_chair'].unique():
-        chair_data = current_data[current_data['fed_chair'] == chair].sort_values('DATE')
-        color = mpl_chair_colors[chair]
-        
+    # Update connecting lines and points for current data
+    segments = []
+    segment_colors = []
+    first_row = current_row + 1
+    for chair in chair_arrays:
         # Skip if this chair is already completed (we show the filled shape instead)
         if chair in completed_chairs:
             continue
-            
-        # Plot line if there's more than one point
-        if len(chair_data) > 1:
-            ax.plot(chair_data['unemployment'], chair_data['core_cpi_yoy'], 
-                    '-', color=color, linewidth=2, alpha=0.8)
         
-        # Plot points
-        ax.scatter(chair_data['unemployment'], chair_data['core_cpi_yoy'], 
-                  c=[color], s=30, alpha=0.9, edgecolors='white', linewidths=1)
+        # This chair's rows up to the current row
+        start_row = chair_start_index[chair]
+        end_row = min(current_row, chair_end_index[chair])
+        if end_row < start_row:
+            continue
+        first_row = min(first_row, start_row)
+        
+        segments.append(row_points[start_row:end_row+1])
+        segment_colors.append(mpl_chair_colors[chair])
+    
+    # Chairs in progress cover the contiguous rows first_row..current_row
+    chair_paths.set_segments(segments)
+    chair_paths.set_color(segment_colors)
+    chair_points.set_offsets(row_points[first_row:current_row+1])
+    chair_points.set_facecolor(row_colors[first_row:current_row+1])
     
     # Highlight the current point
     if frame < len(data) - 1:
-        current_point = data.iloc[frame+1]
-        current_color = mpl_chair_colors[current_point['fed_chair']]
-        
-        #this creates a "pulsing" effect as each new point gets highlighted
-        ax.scatter(current_point['unemployment'], current_point['core_cpi_yoy'], 
-                  s=50, facecolors='none', edgecolors=current_color, linewidths=3)
+        highlight.set_offsets(row_points[current_row:current_row+1])
+        highlight.set_edgecolor(mpl_chair_colors[row_chair[current_row]])
+        highlight.set_visible(True)
+    else:
+        highlight.set_visible(False)
     
     # Add "We are here" annotation for the final point
-    if frame >= len(data) - 1:
-        final_point = data.iloc[-1]
-        ax.annotate('We are here', 
-                   xy=(final_point['unemployment'], final_point['core_cpi_yoy']),
-                   xytext=(final_point['unemployment'] + 1.5, final_point['core_cpi_yoy'] + 1),
-                   arrowprops=dict(arrowstyle='->', color='black', lw=2),
-                   fontsize=10, weight='bold', ha='left')
+    we_are_here.set_visible(frame >= len(data) - 1)
     
-    # Get current info for title and large date display
-    current_date = current_data.iloc[-1]['DATE']
-    current_chair = current_data.iloc[-1]['fed_chair']
+    date_text.set_text(row_date_label[current_row])
     
-    # Add large backdrop date display
-    date_text = current_date.strftime("%b %Y")
-    ax.text(0.98, 0.95, date_text, transform=ax.transAxes, fontsize=24, 
-            weight='bold', ha='right', va='top', alpha=0.7,
-            bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.8, edgecolor='gray'))
+    title.set_text(f'Phillips Curve Path - {row_month_label[current_row]} ({row_chair[current_row]})')
     
-    ax.set_xlim(0, 15)
-    ax.set_ylim(0, 15)
-    ax.set_xlabel('Unemployment Rate (%)')
-    ax.set_ylabel('Core CPI YoY (%)')
-    ax.set_title(f'Phillips Curve Path - {current_date.strftime("%Y-%m")} ({current_chair})')
+    # Show legend entries for chairs seen so far
+    show_legend_chairs([chair for chair, start_index in chair_start_index.items() if start_index <= current_row])
+
+def render_frame(frame):
+    """Draw one frame and return its raw RGBA pixels, so frames can be rendered in worker processes"""
+    global background, background_state
+    animate(frame)
     
-    # Create legend
-    legend_elements = []
-    for chair, color in mpl_chair_colors.items():
-        if chair in current_data['fed_chair'].values or chair in completed_chairs:
-            legend_elements.append(plt.Line2D([0], [0], marker='o', color='w', 
-                                            markerfacecolor=color, markersize=6, label=chair))
+    state = (tuple(polygon.get_visible() for polygon in completed_shapes.values()),
+             tuple((text.get_alpha(), text.get_text()) for text in legend.get_texts()),
+             preview_text.get_visible())
+    if state != background_state:
+        # Animated artists are left out of a regular (non-saving) draw
+        fig.canvas.draw()
+        background = fig.canvas.copy_from_bbox(fig.bbox)
+        background_state = state
+    else:
+        fig.canvas.restore_region(background)
     
-    ax.legend(handles=legend_elements, loc='upper left', fontsize=8)
-    ax.grid(True, alpha=0.3)
+    for artist in frame_artists:
+        fig.draw_artist(artist)
+    return bytes(fig.canvas.buffer_rgba())
 
-# Create frames with single preview frame at the beginning
-total_frames = len(data)
-pause_frames = 25  # Number of frames to repeat the final frame for the pause
-# Frame sequence: preview + animation + pause
-all_frames = [-1] + list(range(total_frames)) + [total_frames-1] * pause_frames
+def render_all_frames(frames, processes, fred_data):
+    """Yield the pixels of every frame in order, rendered in worker processes when processes > 1"""
+    if processes > 1:
+        #Every frame depends only on its frame number, so each worker renders frames on its own copy of
+        #the figure. At most max_pending frames are rendered ahead of the consumer, so frames don't pile
+        #up in memory while ffmpeg falls behind
+        max_pending = 2 * processes
+        with Pool(processes, initializer=init_renderer, initargs=(fred_data, chair_areas)) as pool:
+            pending = deque()
+            for frame in frames:
+                if len(pending) == max_pending:
+                    yield pending.popleft().get()
+                pending.append(pool.apply_async(render_frame, (frame,)))
+            while pending:
+                yield pending.popleft().get()
+    else:
+        for frame in frames:
+            yield render_frame(frame)
 
-#Track animation creation progress
-print(f"Creating matplotlib animation with {len(all_frames)} frames (including 1 preview frame and {pause_frames} pause frames)...")
-pbar = tqdm(total=len(all_frames), desc="Generating frames", leave=False)
+fps = 20
+pause_frames = 25  # Number of frames to hold the final frame for the pause
+video_filter = (f'tpad=stop_mode=clone:stop_duration={pause_frames / fps},'
+                f'scale={output_size[0]}:{output_size[1]}:flags=lanczos')
 
-#Calls the animate function which runs that entire figure creation and pauses for 50milliseconds
-ani = animation.FuncAnimation(fig, animate, frames=all_frames, interval=50, repeat=False)
-ani.save('phillips_matplotlib_filled_shapes_with_preview.gif', writer='pillow', fps=20)
+# Number of processes rendering frames; 1 renders in this process. Counts the CPUs this process
+# may run on, which in a container can be far fewer than os.cpu_count()
+if hasattr(os, 'sched_getaffinity'):
+    render_processes = len(os.sched_getaffinity(0))
+else:
+    render_processes = os.cpu_count() or 1
 
-pbar.close()
-plt.close()
-print("Matplotlib animation complete!")
+if __name__ == '__main__':
+    fred_data = load_fred_data()
+    init_renderer(fred_data)
+    
+    # Create frames with single preview frame at the beginning
+    total_frames = len(data)
+    # Frame sequence: preview + animation; ffmpeg holds the last frame for the pause instead
+    # of rendering it pause_frames more times
+    all_frames = [-1] + list(range(total_frames))
+    
+    #Track animation creation progress
+    print(f"Creating matplotlib animation with {len(all_frames)} frames (including 1 preview frame, plus {pause_frames} pause frames added by ffmpeg)...")
+    
+    #Encode with ffmpeg rather than pillow's GIF quantizer, then build the GIF from the MP4
+    #in a single ffmpeg call that generates and applies an optimized palette
+    mp4_path = 'phillips_matplotlib_filled_shapes_with_preview.mp4'
+    gif_path = 'phillips_matplotlib_filled_shapes_with_preview.gif'
+    ffmpeg_path = plt.rcParams['animation.ffmpeg_path']
+    
+    #Raw frames are piped straight into ffmpeg, which encodes while the next frames render
+    width, height = fig.canvas.get_width_height()
+    ffmpeg = subprocess.Popen([ffmpeg_path, '-y', '-loglevel', 'error',
+                               '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}',
+                               '-framerate', str(fps), '-i', '-',
+                               '-vf', video_filter, '-c:v', 'libx264', '-b:v', '1800k', '-pix_fmt', 'yuv420p', mp4_path],
+                              stdin=subprocess.PIPE)
+    pbar = tqdm(total=len(all_frames), desc="Generating frames", leave=False)
+    #if ffmpeg exits early the write fails; stop feeding it and report its exit status instead
+    pipe_broken = False
+    try:
+        for pixels in render_all_frames(all_frames, render_processes, fred_data):
+            try:
+                ffmpeg.stdin.write(pixels)
+            except OSError:  # BrokenPipeError, or EINVAL on Windows
+                pipe_broken = True
+                break
+            pbar.update(1)
+    except BaseException:
+        #rendering failed or was interrupted; don't leave ffmpeg waiting on its input
+        ffmpeg.kill()
+        ffmpeg.wait()
+        raise
+    try:
+        ffmpeg.stdin.close()
+    except OSError:
+        pipe_broken = True
+    if ffmpeg.wait() != 0 or pipe_broken:
+        raise subprocess.CalledProcessError(ffmpeg.returncode, ffmpeg.args)
+    
+    subprocess.run([ffmpeg_path, '-y', '-loglevel', 'error', '-i', mp4_path,
+                    '-vf', 'split[a][b];[a]palettegen[p];[b][p]paletteuse', gif_path], check=True)
+    
+    pbar.close()
+    plt.close()
+    print("Matplotlib animation complete!")